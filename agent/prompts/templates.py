@@ -5,6 +5,7 @@ Templates with variable substitution for each agent role.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 
@@ -327,69 +328,134 @@ Output actionable feedback with prioritized recommendations.
 """)
 
 
+class _CompiledTemplate:
+    """
+    A string.Template pre-split into literal chunks and placeholder slots.
+
+    Parsing happens once at import time, so rendering is a list fill and a
+    single join instead of a regex walk over the template on every call.
+    Placeholders named in ``constants`` are inlined into the literal chunks
+    up front, leaving only the per-call variables as slots.
+    """
+
+    __slots__ = ('_parts', '_slots')
+
+    def __init__(self, template: Template, constants=None):
+        constants = constants or {}
+        parts = []
+        slots = []
+        literal = []
+        pos = 0
+        text = template.template
+
+        for match in template.pattern.finditer(text):
+            literal.append(text[pos:match.start()])
+            pos = match.end()
+
+            if match.group('escaped') is not None:
+                literal.append(template.delimiter)
+                continue
+
+            name = match.group('named') or match.group('braced')
+            if name is None:
+                raise ValueError(f"Invalid placeholder in template at index {match.start()}")
+
+            if name in constants:
+                literal.append(str(constants[name]))
+                continue
+
+            parts.append(''.join(literal))
+            literal = []
+            slots.append((len(parts), name))
+            parts.append(None)
+
+        literal.append(text[pos:])
+        parts.append(''.join(literal))
+
+        self._parts = parts
+        self._slots = tuple(slots)
+
+    def render(self, **ctx) -> str:
+        """Render the template, filling the remaining variable slots."""
+        parts = self._parts[:]
+        for index, name in self._slots:
+            parts[index] = str(ctx[name])
+        return ''.join(parts)
+
+
+# Shared constants inlined into every compiled template at import time
+_TEMPLATE_CONSTANTS = {
+    'context_prep': AGENT_CONTEXT_PREP,
+    'quality_gate': QUALITY_GATE,
+}
+
+_TEMPLATES = {
+    'researcher': _CompiledTemplate(RESEARCHER_PROMPT_TEMPLATE, _TEMPLATE_CONSTANTS),
+    'outliner': _CompiledTemplate(OUTLINER_PROMPT_TEMPLATE, _TEMPLATE_CONSTANTS),
+    'writer': _CompiledTemplate(WRITER_PROMPT_TEMPLATE, _TEMPLATE_CONSTANTS),
+    'editor': _CompiledTemplate(EDITOR_PROMPT_TEMPLATE, _TEMPLATE_CONSTANTS),
+    'seo_optimizer': _CompiledTemplate(SEO_OPTIMIZER_PROMPT_TEMPLATE, _TEMPLATE_CONSTANTS),
+}
+
+
+@lru_cache(maxsize=64, typed=True)
+def _word_count_range(min_words, max_words):
+    """Format a word count range; specs repeat, so results are memoized."""
+    return f"{min_words}-{max_words}"
+
+
 # Helper functions for template rendering
 def render_researcher_prompt(topic, relevant_context, spec):
     """Render researcher prompt with variables."""
-    return RESEARCHER_PROMPT_TEMPLATE.substitute(
+    return _TEMPLATES['researcher'].render(
         topic=topic,
-        context_prep=AGENT_CONTEXT_PREP,
         relevant_context=relevant_context,
         style=spec.get('style', 'technical'),
-        word_count_range=f"{spec.get('min_words', 800)}-{spec.get('max_words', 2000)}",
+        word_count_range=_word_count_range(spec.get('min_words', 800), spec.get('max_words', 2000)),
         audience=spec.get('audience', 'technical professionals'),
-        requirements=spec.get('requirements', 'Comprehensive technical coverage'),
-        quality_gate=QUALITY_GATE
+        requirements=spec.get('requirements', 'Comprehensive technical coverage')
     )
 
 
 def render_outliner_prompt(topic, research_brief, spec):
     """Render outliner prompt with variables."""
-    return OUTLINER_PROMPT_TEMPLATE.substitute(
+    return _TEMPLATES['outliner'].render(
         topic=topic,
         research_brief=research_brief,
         style=spec.get('style', 'technical'),
-        word_count_range=f"{spec.get('min_words', 800)}-{spec.get('max_words', 2000)}",
+        word_count_range=_word_count_range(spec.get('min_words', 800), spec.get('max_words', 2000)),
         categories=', '.join(spec.get('categories', [])),
-        keywords=', '.join(spec.get('keywords', [])),
-        context_prep=AGENT_CONTEXT_PREP,
-        quality_gate=QUALITY_GATE,
-        total_word_target=spec.get('word_target', 1500)
+        keywords=', '.join(spec.get('keywords', []))
     )
 
 
 def render_writer_prompt(outline, research_context, spec):
     """Render writer prompt with variables."""
-    return WRITER_PROMPT_TEMPLATE.substitute(
+    return _TEMPLATES['writer'].render(
         outline=outline,
         research_context=research_context,
         style=spec.get('style', 'technical'),
-        word_count_range=f"{spec.get('min_words', 800)}-{spec.get('max_words', 2000)}",
+        word_count_range=_word_count_range(spec.get('min_words', 800), spec.get('max_words', 2000)),
         tone=spec.get('tone', 'informative'),
         keywords=', '.join(spec.get('keywords', [])),
-        categories=', '.join(spec.get('categories', [])),
-        context_prep=AGENT_CONTEXT_PREP,
-        quality_gate=QUALITY_GATE
+        categories=', '.join(spec.get('categories', []))
     )
 
 
 def render_editor_prompt(draft_content, spec):
     """Render editor prompt with variables."""
-    return EDITOR_PROMPT_TEMPLATE.substitute(
+    return _TEMPLATES['editor'].render(
         draft_content=draft_content,
-        word_count_range=f"{spec.get('min_words', 800)}-{spec.get('max_words', 2000)}",
-        context_prep=AGENT_CONTEXT_PREP,
-        quality_gate=QUALITY_GATE
+        word_count_range=_word_count_range(spec.get('min_words', 800), spec.get('max_words', 2000))
     )
 
 
 def render_seo_optimizer_prompt(edited_content, spec):
     """Render SEO optimizer prompt with variables."""
-    return SEO_OPTIMIZER_PROMPT_TEMPLATE.substitute(
+    return _TEMPLATES['seo_optimizer'].render(
         edited_content=edited_content,
         keywords=', '.join(spec.get('keywords', [])),
         categories=', '.join(spec.get('categories', [])),
-        word_count_range=f"{spec.get('min_words', 800)}-{spec.get('max_words', 2000)}",
-        keyword_density_target=f"{spec.get('keyword_density', 0.02) * 100:.1f}%",
-        context_prep=AGENT_CONTEXT_PREP,
-        quality_gate=QUALITY_GATE
+        word_count_range=_word_count_range(spec.get('min_words', 800), spec.get('max_words', 2000)),
+        keyword_density_target=f"{spec.get('keyword_density', 0.02) * 100:.1f}%"
     )
@@ -8,16 +8,28 @@ a blog post.
 """
 
 import asyncio
+import contextlib
 import aiohttp
 import feedparser
 import yaml
 import re
+import os
+import json
+import html
 import logging
-from datetime import datetime
-from typing import List, Dict
+from functools import lru_cache
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Add paths for agent imports
 current_dir = Path(__file__).parent
 agent_path = current_dir / "agent"
@@ -37,9 +49,122 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once and reused for every entry
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Per-request limits so a dead feed releases its slot quickly; 5xx responses are retried
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5, sock_read=15)
+FETCH_ATTEMPTS = 3
+
+
+# libyaml C loader when available, pure-Python loader otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _load_feeds_config(path: str, mtime: float) -> Dict:
+    """Load the feeds file; cached until its modification time changes."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def _parse_json_date(value) -> Optional[tuple]:
+    """Convert a JSON Feed RFC 3339 date into a UTC struct_time like feedparser's."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.timetuple()
+
+
+def _is_text(value) -> bool:
+    """Check for a non-empty string."""
+    return isinstance(value, str) and bool(value)
+
+
+def _parse_json_feed(content: bytes) -> Optional[Tuple[Dict, List[Dict]]]:
+    """
+    Parse a JSON Feed document into feedparser-shaped feed info and entries.
+
+    Returns None if the content is not a JSON Feed, so the caller can fall
+    back to feedparser.
+    """
+    try:
+        data = json_loads(content)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get('items'), list):
+        return None
+
+    feed_info = {'title': data['title']} if _is_text(data.get('title')) else {}
+    entries = []
+    for item in data['items']:
+        if not isinstance(item, dict):
+            continue
+        entry = {
+            'summary': item.get('content_html') or item.get('content_text') or item.get('summary') or "",
+            'published_parsed': _parse_json_date(item.get('date_published')),
+        }
+        # Only keep non-empty strings so null or missing values fall back to the defaults
+        if _is_text(item.get('title')):
+            entry['title'] = item['title']
+        if _is_text(item.get('url')):
+            entry['link'] = item['url']
+        entries.append(entry)
+    return feed_info, entries
+
+
+def _entry_text(entry) -> str:
+    """Extract an entry's content with HTML tags stripped."""
+    content = (
+        (entry.get('content') or [{}])[0].get('value')
+        or entry.get('summary')
+        or entry.get('description')
+        or ""
+    )
+
+    # Clean HTML tags, skipping the regex when there are none, then decode entities
+    if '<' in content:
+        content = _TAG_RE.sub('', content)
+    return html.unescape(content).strip()
+
+
+def _select_entries(entries, max_entries: int, min_length: int) -> List[Tuple[Dict, str]]:
+    """Pair the first max_entries entries with enough content with their cleaned text."""
+    selected = []
+    for entry in entries:
+        if len(selected) >= max_entries:
+            break
+        text = _entry_text(entry)
+        if len(text) >= min_length:
+            selected.append((entry, text))
+    return selected
+
+
+def _parse_feed(content, content_type: str, max_entries: int, min_length: int):
+    """
+    Parse feed content in a worker process.
+
+    Returns the feed info and the usable entries paired with their cleaned
+    text, so neither the whole feed nor the HTML cleanup goes back to the parent.
+    """
+    # Pass the HTTP content type so a charset declared only in the header is honoured
+    feed = feedparser.parse(content, response_headers={'content-type': content_type})
+    return feed['feed'], _select_entries(feed['entries'], max_entries, min_length)
+
+
+class _TransientFetchError(Exception):
+    """Raised for a retryable feed download failure."""
+
 
 class ArticleData:
     """Simplified Article data class for fetching."""
+    __slots__ = ('title', 'content', 'url', 'source', 'published')
+
     def __init__(self, title: str, content: str, url: str, source: str, published: datetime):
         self.title = title
         self.content = content
@@ -56,98 +181,234 @@ class FeedFetcher:
         self.min_article_length = 100  # Minimum content length
 
     async def fetch_feeds(self, batch_size: int = 5) -> List[ArticleData]:
-        """Fetch articles from all RSS feeds in batch."""
-        self.logger.info("Starting to fetch RSS feeds...")
-
-        with open(self.feeds_file, 'r') as f:
-            feeds_config = yaml.safe_load(f)
-
-        feeds = feeds_config.get('feeds', [])
-        articles = []
+        """
+        Fetch articles from all RSS feeds, at most batch_size at a time.
 
-        total_feeds = len(feeds)
-        self.logger.info(f"Processing {total_feeds} RSS feeds...")
+        Collects every article into a list; use iter_articles to consume them as they arrive.
+        """
+        articles = [article async for article in self.iter_articles(batch_size)]
 
-        for i in range(0, len(feeds), batch_size):
-            batch = feeds[i:i+batch_size]
-            async with aiohttp.ClientSession() as session:
-                tasks = [self.fetch_single_feed(session, feed_url.strip()) for feed_url in batch]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.logger.info("Total articles fetched: %d", len(articles))
+        return articles
 
-                batch_articles = 0
-                for result in results:
-                    if isinstance(result, list):
-                        articles.extend(result)
-                        batch_articles += len(result)
+    async def iter_articles(self, batch_size: int = 5) -> AsyncIterator[ArticleData]:
+        """
+        Yield articles from all RSS feeds as soon as each feed is parsed.
 
-            self.logger.info(f"Batch {i//batch_size + 1}: Fetched {batch_articles} articles from {len(batch)} feeds")
+        Parsed results are buffered for at most batch_size feeds, so fetching
+        and parsing slow down to match a slow consumer.
+        """
+        self.logger.info("Starting to fetch RSS feeds...")
 
-            # Small delay between batches
-            if i + batch_size < len(feeds):
-                await asyncio.sleep(0.5)
+        feeds_config = _load_feeds_config(self.feeds_file, os.stat(self.feeds_file).st_mtime)
 
-        self.logger.info(f"Total articles fetched: {len(articles)}")
-        return articles
+        feeds = feeds_config.get('feeds', [])
 
-    async def fetch_single_feed(self, session: aiohttp.ClientSession, feed_url: str) -> List[ArticleData]:
-        """Fetch articles from a single RSS feed."""
+        total_feeds = len(feeds)
+        self.logger.info("Processing %d RSS feeds...", total_feeds)
+
+        # One pooled session for the whole run so connections and DNS lookups are reused across feeds
+        connector = aiohttp.TCPConnector(
+            limit=batch_size * 4,
+            limit_per_host=4,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+
+        # Bound concurrency instead of chunking so a slow feed never stalls the others
+        semaphore = asyncio.Semaphore(batch_size)
+        parse_workers = os.cpu_count() or 1
+
+        # Downloads feed a bounded queue that parse workers drain, so the next
+        # feed's bytes are already in flight while the current one is parsed
+        queue = asyncio.Queue(maxsize=batch_size)
+        # Parsed articles per feed, handed to the caller as they complete; None marks the end.
+        # Bounded so parsing waits for the caller instead of piling up results
+        results = asyncio.Queue(maxsize=batch_size)
+
+        async def produce(session: aiohttp.ClientSession, feed_url: str):
+            async with self._downloading(session, feed_url, semaphore) as downloaded:
+                if downloaded is not None:
+                    # Hand off while still holding the slot, so a full parse queue throttles
+                    # downloads and at most batch_size bodies wait outside the queue
+                    await queue.put((feed_url, *downloaded))
+
+        async def consume():
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        return
+                    await results.put(await self._parse_articles(*item, parse_pool=parse_pool))
+                finally:
+                    queue.task_done()
+
+        async def run_pipeline(session: aiohttp.ClientSession):
+            consumers = [asyncio.create_task(consume()) for _ in range(parse_workers)]
+            try:
+                await asyncio.gather(*(produce(session, feed_url.strip()) for feed_url in feeds))
+
+                for _ in consumers:
+                    await queue.put(None)
+                await asyncio.gather(*consumers)
+            except asyncio.CancelledError:
+                # Only cancelled once the caller has stopped reading, so no end marker is needed
+                raise
+            except Exception:
+                await results.put(None)
+                raise
+            finally:
+                for consumer in consumers:
+                    consumer.cancel()
+            await results.put(None)
+
+        # feedparser is pure Python and holds the GIL, so parse in worker processes
+        parse_pool = ProcessPoolExecutor(max_workers=parse_workers)
         try:
-            async with session.get(feed_url, timeout=30) as response:
-                response.raise_for_status()
-                content = await response.text()
-
-            feed = feedparser.parse(content)
-            articles = []
-
-            fetched_count = 0
-            for entry in feed.entries:
-                if fetched_count >= self.max_articles_per_feed:
-                    break
-
-                article_content = self.extract_content(entry)
-                if len(article_content) < self.min_article_length:
+            async with aiohttp.ClientSession(connector=connector, timeout=FETCH_TIMEOUT) as session:
+                pipeline = asyncio.create_task(run_pipeline(session))
+                try:
+                    while True:
+                        feed_articles = await results.get()
+                        if feed_articles is None:
+                            break
+                        for article in feed_articles:
+                            yield article
+                    await pipeline
+                finally:
+                    # Stop outstanding work if the caller stops iterating early
+                    if not pipeline.done():
+                        pipeline.cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await pipeline
+        finally:
+            # Shutting down waits for in-flight parses, so keep it off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, parse_pool.shutdown)
+
+    async def fetch_single_feed(
+        self,
+        session: aiohttp.ClientSession,
+        feed_url: str,
+        parse_pool: Optional[Executor] = None
+    ) -> List[ArticleData]:
+        """Fetch articles from a single RSS feed, parsing in the loop's default executor unless given a pool."""
+        async with self._downloading(session, feed_url, asyncio.Semaphore()) as downloaded:
+            pass
+        if downloaded is None:
+            return []
+        return await self._parse_articles(feed_url, *downloaded, parse_pool=parse_pool)
+
+    @contextlib.asynccontextmanager
+    async def _downloading(
+        self,
+        session: aiohttp.ClientSession,
+        feed_url: str,
+        slot: asyncio.Semaphore
+    ) -> AsyncIterator[Optional[Tuple[bytes, str]]]:
+        """
+        Download a feed, retrying 5xx responses, and hold `slot` while the result is in use.
+
+        The slot is only held during requests and the caller's block; backoff
+        sleeps happen outside it so a failing feed doesn't starve the others.
+        Yields None on failure.
+        """
+        for attempt in range(FETCH_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+            async with slot:
+                try:
+                    downloaded = await self._download(session, feed_url, attempt == FETCH_ATTEMPTS - 1)
+                except _TransientFetchError:
                     continue
-
-                article = ArticleData(
-                    title=entry.get('title', 'No Title'),
-                    content=article_content,
-                    url=entry.get('link', ''),
-                    source=feed.feed.get('title', feed_url),
-                    published=self.parse_date(entry)
+                yield downloaded
+                return
+
+    async def _download(
+        self,
+        session: aiohttp.ClientSession,
+        feed_url: str,
+        last_attempt: bool = True
+    ) -> Optional[Tuple[bytes, str]]:
+        """
+        Make one attempt at downloading a raw feed body and its content type.
+
+        Returns None on failure. A 5xx response raises _TransientFetchError
+        instead, unless this is the last attempt.
+        """
+        try:
+            async with session.get(feed_url, timeout=FETCH_TIMEOUT) as response:
+                response.raise_for_status()
+                # Raw bytes plus the content type: feedparser decodes using the header charset
+                return await response.read(), response.headers.get('Content-Type', '')
+        except aiohttp.ClientResponseError as e:
+            # Only 5xx responses are worth retrying
+            if e.status >= 500 and not last_attempt:
+                raise _TransientFetchError(feed_url) from e
+            self.logger.warning("Error fetching %s: %s", feed_url, e)
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Timeouts are not retried, so a dead feed holds its slot for at most one timeout
+            self.logger.warning("Error fetching %s: %s", feed_url, e)
+            return None
+        except Exception:
+            self.logger.exception("Unexpected error fetching %s", feed_url)
+            return None
+
+    async def _parse_articles(
+        self,
+        feed_url: str,
+        content: bytes,
+        content_type: str = '',
+        parse_pool: Optional[Executor] = None
+    ) -> List[ArticleData]:
+        """Parse a downloaded feed and build articles from its entries."""
+        try:
+            max_articles = self.max_articles_per_feed
+            min_length = self.min_article_length
+
+            # JSON Feed sources skip feedparser entirely; anything else goes to the parse pool
+            parsed = _parse_json_feed(content) if 'json' in content_type else None
+            if parsed is not None:
+                feed_info, entries = parsed
+                selected = _select_entries(entries, max_articles, min_length)
+            else:
+                loop = asyncio.get_running_loop()
+                feed_info, selected = await loop.run_in_executor(
+                    parse_pool, _parse_feed, content, content_type, max_articles, min_length
                 )
 
-                articles.append(article)
-                fetched_count += 1
+            source = feed_info.get('title', feed_url)
+            now = datetime.now()  # Shared fallback publish time for undated entries
+            build_article = self._build_article
+            articles = [build_article(entry, text, source, now) for entry, text in selected]
 
-            self.logger.info(f"Fetched {len(articles)} articles from {feed_url}")
+            self.logger.info("Fetched %d articles from %s", len(articles), feed_url)
             return articles
 
-        except Exception as e:
-            self.logger.warning(f"Error fetching {feed_url}: {e}")
+        except Exception:
+            # feedparser tolerates malformed feeds, so anything raised here is a real bug
+            self.logger.exception("Unexpected error parsing %s", feed_url)
             return []
 
-    def extract_content(self, entry) -> str:
-        """Extract and clean content from RSS entry."""
-        content = ""
-        for field in ['content', 'summary', 'description']:
-            if hasattr(entry, field):
-                if field == 'content' and entry.content:
-                    content = entry.content[0].value if entry.content else ""
-                else:
-                    content = getattr(entry, field, "")
-                break
-
-        # Clean HTML tags
-        return re.sub(r'<[^>]+>', '', content).strip()
-
-    def parse_date(self, entry) -> datetime:
-        """Parse publication date from RSS entry."""
-        try:
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                return datetime(*entry.published_parsed[:6])
-        except:
-            pass
-        return datetime.now()
+    def _build_article(self, entry, content: str, source: str, now: datetime) -> ArticleData:
+        """Build an article from an entry and its already cleaned content."""
+        return ArticleData(
+            title=entry.get('title', 'No Title'),
+            content=content,
+            url=entry.get('link', ''),
+            source=source,
+            published=self.parse_date(entry, now)
+        )
+
+    def parse_date(self, entry, now: Optional[datetime] = None) -> datetime:
+        """Parse publication date from RSS entry, falling back to now."""
+        published_parsed = entry.get('published_parsed')
+        if published_parsed:
+            try:
+                return datetime(*published_parsed[:6])
+            except (TypeError, ValueError):
+                pass
+        return now or datetime.now()
 
 
 class BlogTopicGenerator: